@@ -1,12 +1,31 @@
 
 import asyncio
+import functools
+import logging
+import logging.handlers
+import math
 import random
-import datetime
-import statistics
-from openlocationcode import openlocationcode as olc
+import time
+from enum import IntEnum
+import numpy as np
+
+# --- Salida por lotes: las trazas se acumulan en memoria y se vuelcan en
+# bloque, evitando un write() por cada print en el bucle de eventos ---
+
+registro = logging.getLogger("camion")
+salida_lotes = logging.handlers.MemoryHandler(capacity=64, target=logging.StreamHandler())
+registro.addHandler(salida_lotes)
+registro.setLevel(logging.INFO)
+registro.propagate = False
 
 # --- Patron Observer para notificaciones de actualización de datos ---
 
+class CategoriaNotificacion(IntEnum):
+    # Categorías como enteros: comparar y despachar por categoría es una
+    # comparación de int en vez de una igualdad de cadenas
+    TEMPERATURA = 1
+    VARIACION = 2
+
 class Notificacion:
     def __init__(self, titulo, categoria, prioridad):
         self.titulo = titulo
@@ -15,17 +34,30 @@ class Notificacion:
 
 class Publicador:
     def __init__(self):
-        self.suscriptores = []
+        # Tabla de despacho por categoría: cada notificación solo recorre los
+        # suscriptores interesados (None = suscrito a todas las categorías)
+        self.suscriptores = {}
 
-    def suscribir(self, observer):
-        self.suscriptores.append(observer)
+    def suscribir(self, observer, categoria=None, min_prioridad=0):
+        # Diccionario indexado por id(observer): baja en O(1) manteniendo el
+        # orden de suscripción para un despacho determinista
+        self.suscriptores.setdefault(categoria, {})[id(observer)] = (min_prioridad, observer)
 
     def desuscribir(self, observer):
-        self.suscriptores.remove(observer)
+        for subs in self.suscriptores.values():
+            subs.pop(id(observer), None)
 
     def notificar(self, notificacion):
-        for sub in self.suscriptores:
-            sub.actualizar(notificacion)
+        # Sin repetir None: una notificación sin categoría solo debe llegar
+        # una vez a los suscriptores de todas las categorías
+        if notificacion.categoria is None:
+            categorias = (None,)
+        else:
+            categorias = (notificacion.categoria, None)
+        for categoria in categorias:
+            for min_prioridad, sub in self.suscriptores.get(categoria, {}).values():
+                if notificacion.prioridad >= min_prioridad:
+                    sub.actualizar(notificacion)
 
 class Suscriptor:
     def actualizar(self, notificacion):
@@ -36,15 +68,45 @@ class SuscriptorGeneral(Suscriptor):
         self.nombre = nombre
 
     def actualizar(self, notificacion):
-        print(f"{self.nombre} recibió notificación: {notificacion.titulo}")
+        registro.info(f"{self.nombre} recibió notificación: {notificacion.titulo}")
 
 class SuscriptorTemperaturaAlta(Suscriptor):
     def __init__(self, nombre):
         self.nombre = nombre
 
     def actualizar(self, notificacion):
-        if notificacion.categoria == "Temperatura" and notificacion.prioridad >= 8:
-            print(f"{self.nombre} alerta temperatura alta: {notificacion.titulo}")
+        # El filtro por categoría y prioridad se aplica al suscribirse,
+        # así que aquí ya solo llegan las notificaciones relevantes
+        registro.info(f"{self.nombre} alerta temperatura alta: {notificacion.titulo}")
+
+# --- Reducción fusionada: todos los estadísticos en una sola pasada ---
+
+# Numba es opcional: si está disponible compila el kernel a código nativo
+# vectorizado; si no, la versión Python pura sigue funcionando igual
+try:
+    from numba import njit
+except ImportError:
+    njit = None
+
+def reducir_estadisticos(a):
+    # Suma, suma de cuadrados, mínimo y máximo de un array en una única
+    # pasada, en lugar de recorrerlo una vez por cada estadístico
+    s = 0.0
+    s2 = 0.0
+    mn = a[0]
+    mx = a[0]
+    for i in range(a.shape[0]):
+        v = a[i]
+        s += v
+        s2 += v * v
+        if v < mn:
+            mn = v
+        if v > mx:
+            mx = v
+    return s, s2, mn, mx
+
+if njit is not None:
+    reducir_estadisticos = njit(cache=True, fastmath=True)(reducir_estadisticos)
 
 # --- Patron Chain of Responsibility para procesamiento de datos en pasos ---
 
@@ -61,30 +123,31 @@ class EstadisticasHandler(Handler):
         super().__init__(siguiente)
 
     async def manejar(self, datos):
-        # Datos es lista de tuplas (timestamp, temp, lon, lat, humedad)
-        now = datetime.datetime.now()
-        hace_60s = now - datetime.timedelta(seconds=60)
-        recientes = list(filter(lambda d: d[0] >= hace_60s, datos))
-        temps = list(map(lambda d: d[1], recientes))
-        hums = list(map(lambda d: d[4], recientes))
+        # Las sumas de la ventana de 60s se mantienen incrementalmente al
+        # recibir cada dato: aquí solo se expiran los datos viejos y se
+        # derivan media y desviación en O(1), sin recorrer la ventana
+        hace_60s = time.monotonic() - 60.0
+        datos.expirar(hace_60s)
+        c = datos.n_ventana
 
         # Estadísticos seguros: revisar si tenemos suficientes datos para desviacion
-        if len(temps) > 1:
-            media_temp = statistics.mean(temps)
-            desv_temp = statistics.stdev(temps)
+        if c > 1:
+            media_temp = datos.suma_temp / c
+            var_temp = (datos.suma_temp2 - datos.suma_temp ** 2 / c) / (c - 1)
+            desv_temp = max(var_temp, 0.0) ** 0.5
+            media_hum = datos.suma_hum / c
+            var_hum = (datos.suma_hum2 - datos.suma_hum ** 2 / c) / (c - 1)
+            desv_hum = max(var_hum, 0.0) ** 0.5
         else:
-            media_temp = temps[0] if temps else None
+            # Con una sola muestra la "media" es el propio valor: redondear
+            # para que no asome el ruido de f4 del dato almacenado
+            media_temp = round(datos.suma_temp, 2) if c else None
             desv_temp = 0
-
-        if len(hums) > 1:
-            media_hum = statistics.mean(hums)
-            desv_hum = statistics.stdev(hums)
-        else:
-            media_hum = hums[0] if hums else None
+            media_hum = round(datos.suma_hum, 2) if c else None
             desv_hum = 0
 
-        print(f"[Estadísticas] Media Temp: {media_temp}, Desv Temp: {desv_temp}")
-        print(f"[Estadísticas] Media Hum: {media_hum}, Desv Hum: {desv_hum}")
+        registro.info(f"[Estadísticas] Media Temp: {media_temp}, Desv Temp: {desv_temp}")
+        registro.info(f"[Estadísticas] Media Hum: {media_hum}, Desv Hum: {desv_hum}")
 
         # Guardamos estos estadísticos para siguiente paso en el objeto datos
         datos.estadisticas = {
@@ -99,14 +162,15 @@ class UmbralTemperaturaHandler(Handler):
     UMBRAL_TEMP = 25.0  # ejemplo de umbral en grados Celsius
 
     async def manejar(self, datos):
-        # Última temperatura recibida
-        temp_actual = datos.ultimo_dato[1]
+        # Última temperatura recibida, leída directamente de la columna;
+        # redondeada al salir de f4 para no mostrar ruido de float32
+        temp_actual = round(float(datos.temp[datos.n - 1]), 2)
         if temp_actual > self.UMBRAL_TEMP:
-            print(f"[Alerta] Temperatura alta detectada: {temp_actual} > {self.UMBRAL_TEMP}")
+            registro.info(f"[Alerta] Temperatura alta detectada: {temp_actual} > {self.UMBRAL_TEMP}")
             datos.publicador.notificar(
                 Notificacion(
                     titulo=f"Temperatura alta: {temp_actual}C",
-                    categoria="Temperatura",
+                    categoria=CategoriaNotificacion.TEMPERATURA,
                     prioridad=9
                 )
             )
@@ -114,19 +178,22 @@ class UmbralTemperaturaHandler(Handler):
 
 class VariacionHandler(Handler):
     async def manejar(self, datos):
-        now = datetime.datetime.now()
-        hace_30s = now - datetime.timedelta(seconds=30)
-        recientes_30s = list(filter(lambda d: d[0] >= hace_30s, datos))
-        temps = list(map(lambda d: d[1], recientes_30s))
-        hums = list(map(lambda d: d[4], recientes_30s))
-
-        if temps and hums:
-            if (max(temps) - min(temps)) > 2 or (max(hums) - min(hums)) > 2:
-                print(f"[Alerta] Variación en temperatura/humedad > 2 grados en últimos 30s")
+        hace_30s = time.monotonic() - 30.0
+        n = datos.n
+        i = np.searchsorted(datos.ts[:n], hace_30s)
+        temps = datos.temp[i:n]
+        hums = datos.hum[i:n]
+
+        if temps.size and hums.size:
+            # Una sola pasada por columna en vez de min y max por separado
+            _, _, min_t, max_t = reducir_estadisticos(temps)
+            _, _, min_h, max_h = reducir_estadisticos(hums)
+            if (max_t - min_t) > 2 or (max_h - min_h) > 2:
+                registro.info(f"[Alerta] Variación en temperatura/humedad > 2 grados en últimos 30s")
                 datos.publicador.notificar(
                     Notificacion(
                         titulo="Variación brusca en temperatura o humedad",
-                        categoria="Variación",
+                        categoria=CategoriaNotificacion.VARIACION,
                         prioridad=8
                     )
                 )
@@ -140,46 +207,119 @@ class CalculoStrategy:
 
 class CalculoMedia(CalculoStrategy):
     async def calcular(self, datos):
-        temps = list(map(lambda d: d[1], datos))
-        if temps:
-            media = sum(temps) / len(temps)
-            print(f"[Strategy] Media temperatura: {media:.2f}")
+        # Recorre la fuente directamente sin materializar una lista intermedia
+        suma = 0.0
+        n = 0
+        for d in datos:
+            suma += d[1]
+            n += 1
+        if n:
+            media = suma / n
+            registro.info(f"[Strategy] Media temperatura: {media:.2f}")
             return media
         return None
 
 class CalculoDesviacion(CalculoStrategy):
     async def calcular(self, datos):
-        temps = list(map(lambda d: d[1], datos))
-        if len(temps) > 1:
-            desv = statistics.stdev(temps)
-            print(f"[Strategy] Desviación temperatura: {desv:.2f}")
+        # Una sola pasada acumulando suma y suma de cuadrados: sin lista
+        # intermedia y sin el paso por Fraction de statistics.stdev
+        suma = 0.0
+        suma2 = 0.0
+        n = 0
+        for d in datos:
+            v = d[1]
+            suma += v
+            suma2 += v * v
+            n += 1
+        if n > 1:
+            var = (suma2 - suma * suma / n) / (n - 1)
+            desv = math.sqrt(max(var, 0.0))
+            registro.info(f"[Strategy] Desviación temperatura: {desv:.2f}")
             return desv
         return 0
 
+class CalculoMediaDesv(CalculoStrategy):
+    async def calcular(self, datos):
+        # Media y desviación juntas en una pasada vectorizada: equivale a
+        # ejecutar las dos estrategias anteriores sin el doble recorrido
+        temps = np.fromiter((d[1] for d in datos), dtype='f8')
+        if temps.size == 0:
+            return None, 0
+        media = temps.mean()
+        desv = temps.std(ddof=1) if temps.size > 1 else 0
+        registro.info(f"[Strategy] Media temperatura: {media:.2f}, desviación: {desv:.2f}")
+        return media, desv
+
 # --- Patron Adapter para convertir coordenadas GMS a OLC ---
 
 # Sistema legado: recibe GMS
+UN_SESENTAVO = 1 / 60
+UN_TRESMILSEISCIENTOSAVO = 1 / 3600
+
 def gms_a_decimal(grados, minutos, segundos, direccion):
-    decimal = grados + minutos / 60 + segundos / 3600
-    if direccion in ['S', 'W']:
+    # Multiplicar por los recíprocos precalculados evita dos divisiones
+    # en coma flotante por llamada
+    decimal = grados + minutos * UN_SESENTAVO + segundos * UN_TRESMILSEISCIENTOSAVO
+    if direccion == 'S' or direccion == 'W':
         decimal *= -1
     return decimal
 
-def gms_a_olc(lat_gms, lon_gms):
+# Codificador Plus Code especializado a la precisión de 10 dígitos que usa
+# la aplicación: escala lat/lon a enteros y extrae los dígitos base 20 con
+# divmod, evitando los bucles genéricos de la librería de referencia
+ALFABETO_OLC = "23456789CFGHJMPQRVWX"
+
+def codificar_olc10(lat, lon):
+    if lat < -90:
+        lat = -90
+    elif lat >= 90:
+        lat = 90 - 0.000125  # el polo se ajusta a la última celda de 1/8000°
+    while lon >= 180:
+        lon -= 360
+    while lon < -180:
+        lon += 360
+    # Aritmética entera idéntica a la de la librería de referencia: se
+    # redondea a la precisión máxima (1/25e6 y 1/8.192e6 de grado) y después
+    # se divide a la celda de 1/8000°, de modo que los decimales que caen
+    # justo en el borde de una celda se resuelven igual que en olc.encode
+    lat_val = int(round((lat + 90) * 25000000, 6)) // 3125
+    lon_val = int(round((lon + 180) * 8192000, 6)) // 1024
+    digitos = []
+    for _ in range(5):
+        lat_val, d_lat = divmod(lat_val, 20)
+        lon_val, d_lon = divmod(lon_val, 20)
+        digitos.append(ALFABETO_OLC[d_lon])
+        digitos.append(ALFABETO_OLC[d_lat])
+    digitos.reverse()
+    return ''.join(digitos[:8]) + '+' + ''.join(digitos[8:])
+
+# Las tuplas GMS son hashables: la caché evita repetir la conversión a
+# decimal y la codificación OLC cuando una posición se repite
+@functools.lru_cache(maxsize=8192)
+def gms_a_decimal_olc(lat_gms, lon_gms):
     lat_decimal = gms_a_decimal(*lat_gms)
     lon_decimal = gms_a_decimal(*lon_gms)
-    return olc.encode(lat_decimal, lon_decimal)
+    return lat_decimal, lon_decimal, codificar_olc10(lat_decimal, lon_decimal)
+
+def gms_a_olc(lat_gms, lon_gms):
+    return gms_a_decimal_olc(lat_gms, lon_gms)[2]
 
 # Interfaz esperada nueva
 class InterfaceCoordenadas:
     def convertir_a_olc(self, lat_gms, lon_gms):
         raise NotImplementedError()
 
+    def convertir_completo(self, lat_gms, lon_gms):
+        raise NotImplementedError()
+
 # Sistema legado con método distinto
 class SistemaGMS:
     def obtener_olc(self, lat_gms, lon_gms):
         return gms_a_olc(lat_gms, lon_gms)
 
+    def obtener_decimal_olc(self, lat_gms, lon_gms):
+        return gms_a_decimal_olc(lat_gms, lon_gms)
+
 # Adaptador
 class AdaptadorCoordenadas(InterfaceCoordenadas):
     def __init__(self, sistema_gms):
@@ -188,25 +328,27 @@ class AdaptadorCoordenadas(InterfaceCoordenadas):
     def convertir_a_olc(self, lat_gms, lon_gms):
         return self.sistema_gms.obtener_olc(lat_gms, lon_gms)
 
+    def convertir_completo(self, lat_gms, lon_gms):
+        # Devuelve (lat_decimal, lon_decimal, olc) en una sola llamada
+        return self.sistema_gms.obtener_decimal_olc(lat_gms, lon_gms)
+
 # --- Funciones para generar coordenadas aleatorias en GMS ---
 
 def decimal_a_gms_lat(decimal):
+    # Aritmética entera en centésimas de segundo: un solo redondeo y dos
+    # divmod en lugar de truncamientos en coma flotante encadenados
     direccion = 'N' if decimal >= 0 else 'S'
-    decimal = abs(decimal)
-    grados = int(decimal)
-    minutos_dec = (decimal - grados) * 60
-    minutos = int(minutos_dec)
-    segundos = round((minutos_dec - minutos) * 60, 2)
-    return (grados, minutos, segundos, direccion)
+    total = round(abs(decimal) * 360000)
+    grados, total = divmod(total, 360000)
+    minutos, total = divmod(total, 6000)
+    return (grados, minutos, total / 100, direccion)
 
 def decimal_a_gms_lon(decimal):
     direccion = 'E' if decimal >= 0 else 'W'
-    decimal = abs(decimal)
-    grados = int(decimal)
-    minutos_dec = (decimal - grados) * 60
-    minutos = int(minutos_dec)
-    segundos = round((minutos_dec - minutos) * 60, 2)
-    return (grados, minutos, segundos, direccion)
+    total = round(abs(decimal) * 360000)
+    grados, total = divmod(total, 360000)
+    minutos, total = divmod(total, 6000)
+    return (grados, minutos, total / 100, direccion)
 
 def generar_coordenadas_aleatorias():
     lat_decimal = random.uniform(-90, 90)
@@ -217,51 +359,181 @@ def generar_coordenadas_aleatorias():
 
 # --- Datos del camión con almacenamiento y publicador para notificaciones ---
 
-class DatosCamion(list):
+# Registro compacto por muestra: timestamp en f8 y campos de sensor en f4
+# (la precisión de los sensores es de centésimas, float32 sobra)
+DTYPE_MUESTRA = np.dtype([
+    ('ts', 'f8'),
+    ('temp', 'f4'),
+    ('lon', 'f4'),
+    ('lat', 'f4'),
+    ('hum', 'f4'),
+])
+
+class DatosCamion:
+    CAPACIDAD_INICIAL = 128
+
     def __init__(self, publicador):
-        super().__init__()
         self.publicador = publicador
         self.estadisticas = {}
-        self.ultimo_dato = None
+        # Señal para el procesador: se activa al recibir un dato nuevo, así
+        # el consumidor no se despierta cuando no hay nada que procesar
+        self.nuevo_dato = asyncio.Event()
+        # Un único array estructurado (SoA por campos) en lugar de tuplas
+        # Python: 24 bytes por muestra y reducciones sobre buffers numpy
+        self.muestras = np.empty(self.CAPACIDAD_INICIAL, dtype=DTYPE_MUESTRA)
+        self.n = 0
+        # Agregados incrementales de la ventana de 60s: se suman al recibir
+        # cada dato y se restan al expirar, así los estadísticos se leen en O(1)
+        self.inicio_ventana = 0
+        self.suma_temp = 0.0
+        self.suma_temp2 = 0.0
+        self.suma_hum = 0.0
+        self.suma_hum2 = 0.0
+
+    # Vistas por campo sobre el mismo buffer, para que los handlers sigan
+    # trabajando con columnas
+    @property
+    def ts(self):
+        return self.muestras['ts']
+
+    @property
+    def temp(self):
+        return self.muestras['temp']
+
+    @property
+    def lon(self):
+        return self.muestras['lon']
+
+    @property
+    def lat(self):
+        return self.muestras['lat']
+
+    @property
+    def hum(self):
+        return self.muestras['hum']
+
+    def __len__(self):
+        return self.n
+
+    def __iter__(self):
+        # Compatibilidad con el acceso por tuplas (timestamp, temp, lon, lat, humedad)
+        for i in range(self.n):
+            yield tuple(self.muestras[i])
+
+    def _ampliar(self):
+        nuevas = np.empty(self.muestras.size * 2, dtype=DTYPE_MUESTRA)
+        nuevas[:self.n] = self.muestras[:self.n]
+        self.muestras = nuevas
+
+    def _compactar(self):
+        # Desplaza la ventana viva al principio del buffer y descarta los
+        # datos ya expirados: la memoria queda acotada por el tamaño de la
+        # ventana de 60s en vez de crecer sin límite con el histórico
+        vivos = self.n - self.inicio_ventana
+        if self.inicio_ventana > 0:
+            self.muestras[:vivos] = self.muestras[self.inicio_ventana:self.n]
+            self.n = vivos
+            self.inicio_ventana = 0
+        if self.n == self.muestras.size:
+            self._ampliar()
+
+    def append(self, dato):
+        timestamp, temperatura, lon, lat, humedad = dato
+        if self.n == self.ts.size:
+            self._compactar()
+        i = self.n
+        self.muestras[i] = (timestamp, temperatura, lon, lat, humedad)
+        self.n = i + 1
+        # Acumular los valores ya redondeados a f4: así lo que se resta en
+        # expirar coincide exactamente con lo que se sumó aquí
+        temperatura = float(self.muestras['temp'][i])
+        humedad = float(self.muestras['hum'][i])
+        self.suma_temp += temperatura
+        self.suma_temp2 += temperatura * temperatura
+        self.suma_hum += humedad
+        self.suma_hum2 += humedad * humedad
+        self.nuevo_dato.set()
+
+    def expirar(self, corte):
+        # Saca de la ventana los datos anteriores al corte restando su
+        # contribución a las sumas acumuladas
+        j = self.inicio_ventana + np.searchsorted(self.ts[self.inicio_ventana:self.n], corte)
+        if j > self.inicio_ventana:
+            # Acumular en f8 aunque las columnas sean f4, igual que en append
+            viejas_t = self.temp[self.inicio_ventana:j].astype('f8')
+            viejas_h = self.hum[self.inicio_ventana:j].astype('f8')
+            self.suma_temp -= viejas_t.sum()
+            self.suma_temp2 -= (viejas_t * viejas_t).sum()
+            self.suma_hum -= viejas_h.sum()
+            self.suma_hum2 -= (viejas_h * viejas_h).sum()
+            self.inicio_ventana = j
+
+    @property
+    def n_ventana(self):
+        return self.n - self.inicio_ventana
+
+    @property
+    def ultimo_dato(self):
+        # Derivado de las columnas: no hace falta guardar una tupla aparte
+        if self.n == 0:
+            return None
+        i = self.n - 1
+        return (self.ts[i], self.temp[i], self.lon[i], self.lat[i], self.hum[i])
 
 # --- Simulación de recepción y procesamiento de datos de camiones ---
 
+TAMANO_LOTE = 256  # muestras aleatorias generadas de golpe por lote
+
 async def simular_recepcion_datos(camion_id, datos_camion, adaptador_coord):
+    # Los valores aleatorios se generan por lotes con NumPy: el coste del RNG
+    # y del redondeo sale del bucle y se amortiza entre TAMANO_LOTE muestras
+    rng = np.random.default_rng()
     while True:
-        timestamp = datetime.datetime.now()
-        temperatura = round(random.uniform(15, 30), 2)  # Temperatura entre 15 y 30 °C
-        humedad = round(random.uniform(30, 70), 2)     # Humedad relativa entre 30% y 70%
-        lat_gms, lon_gms = generar_coordenadas_aleatorias()
-        olc_code = adaptador_coord.convertir_a_olc(lat_gms, lon_gms)
-
-        # Guardar datos: (timestamp, temp, lon_decimal, lat_decimal, humedad)
-        lon_decimal = gms_a_decimal(*lon_gms)
-        lat_decimal = gms_a_decimal(*lat_gms)
-
-        datos_camion.append((timestamp, temperatura, lon_decimal, lat_decimal, humedad))
-        datos_camion.ultimo_dato = (timestamp, temperatura, lon_decimal, lat_decimal, humedad)
-
-        print(f"Camión {camion_id} datos recibidos: temp={temperatura}°C, hum={humedad}%, OLC={olc_code}")
-
-        await asyncio.sleep(random.uniform(1, 3))  # Simula tiempo variable entre datos
+        lats = rng.uniform(-90, 90, TAMANO_LOTE)
+        lons = rng.uniform(-180, 180, TAMANO_LOTE)
+        temps = rng.uniform(15, 30, TAMANO_LOTE).round(2)  # Temperatura entre 15 y 30 °C
+        hums = rng.uniform(30, 70, TAMANO_LOTE).round(2)   # Humedad relativa entre 30% y 70%
+        esperas = rng.uniform(1, 3, TAMANO_LOTE)           # Tiempo variable entre datos
+        for i in range(TAMANO_LOTE):
+            timestamp = time.monotonic()
+            temperatura = float(temps[i])
+            humedad = float(hums[i])
+            lat_decimal = float(lats[i])
+            lon_decimal = float(lons[i])
+            # Los decimales se guardan directamente; el paso por GMS queda solo
+            # para alimentar al adaptador que codifica el OLC mostrado
+            lat_gms = decimal_a_gms_lat(lat_decimal)
+            lon_gms = decimal_a_gms_lon(lon_decimal)
+            olc_code = adaptador_coord.convertir_a_olc(lat_gms, lon_gms)
+
+            datos_camion.append((timestamp, temperatura, lon_decimal, lat_decimal, humedad))
+
+            registro.info(f"Camión {camion_id} datos recibidos: temp={temperatura}°C, hum={humedad}%, OLC={olc_code}")
+
+            # Espera precalculada en el lote: sin llamada al RNG por iteración
+            await asyncio.sleep(float(esperas[i]))
 
 async def procesar_datos(camion_id, datos_camion, cadena_procesamiento):
     while True:
-        if len(datos_camion) > 0:
-            await cadena_procesamiento.manejar(datos_camion)
-        await asyncio.sleep(5)  # Procesar cada 5 segundos
+        # Espera dirigida por eventos: solo despierta cuando hay datos nuevos,
+        # sin ciclos de sondeo en vacío
+        await datos_camion.nuevo_dato.wait()
+        datos_camion.nuevo_dato.clear()
+        await cadena_procesamiento.manejar(datos_camion)
+        salida_lotes.flush()  # Volcado en bloque de lo acumulado en el ciclo
+        await asyncio.sleep(5)  # Cadencia mínima entre procesados
 
 # --- Ejemplo principal para correr todo junto ---
 
 async def main():
-    print("Sistema logístico iniciado.")
+    registro.info("Sistema logístico iniciado.")
 
     # Crear publicador y suscriptores
     publicador = Publicador()
     suscriptor_general = SuscriptorGeneral("Administrador")
     suscriptor_temp = SuscriptorTemperaturaAlta("AlertaTemperatura")
     publicador.suscribir(suscriptor_general)
-    publicador.suscribir(suscriptor_temp)
+    publicador.suscribir(suscriptor_temp, categoria=CategoriaNotificacion.TEMPERATURA, min_prioridad=8)
 
     # Crear adaptador para coordenadas
     sistema_gms = SistemaGMS()